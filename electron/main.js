@@ -1,6 +1,5 @@
 const { app, BrowserWindow, BrowserView, ipcMain, Menu, shell } = require('electron')
 const path = require('path')
-const Groq = require('groq-sdk')
 require('dotenv').config()
 
 console.log('🔑 Environment variables loaded:', !!process.env.GROQ_API_KEY)
@@ -12,6 +11,44 @@ const { AgentPerformanceMonitor } = require('../src/backend/AgentPerformanceMoni
 const { BackgroundTaskScheduler } = require('../src/backend/BackgroundTaskScheduler.js')
 const { EnhancedAgentController } = require('../src/core/agents/EnhancedAgentController.js')
 
+const AGENT_TASK_PATTERNS = {
+  research: {
+    keywords: ['research', 'find', 'search', 'investigate', 'study', 'explore'],
+    confidence: 90
+  },
+  navigation: {
+    keywords: ['navigate', 'go to', 'visit', 'open', 'browse', 'website'],
+    confidence: 95
+  },
+  shopping: {
+    keywords: ['buy', 'purchase', 'shop', 'price', 'deal', 'product'],
+    confidence: 90
+  },
+  communication: {
+    keywords: ['email', 'write', 'compose', 'message', 'letter'],
+    confidence: 90
+  },
+  automation: {
+    keywords: ['automate', 'schedule', 'workflow', 'task', 'repeat'],
+    confidence: 90
+  },
+  analysis: {
+    keywords: ['analyze', 'review', 'examine', 'evaluate', 'assess'],
+    confidence: 90
+  }
+}
+
+// Static part of the AI system prompt; only the page context varies per message
+const AI_SYSTEM_PROMPT_HEADER = `You are KAiro AI, an advanced browser assistant with real browser automation capabilities.
+
+You have 6 specialized agents:
+- 🔍 Research Agent: Multi-source research and analysis
+- 🌐 Navigation Agent: Smart web navigation
+- 🛒 Shopping Agent: Product research and comparison  
+- 📧 Communication Agent: Email and message composition
+- 🤖 Automation Agent: Task automation and workflows
+- 📊 Analysis Agent: Content analysis and insights`
+
 class OptimizedBrowserManager {
   constructor() {
     this.mainWindow = null
@@ -69,6 +106,9 @@ class OptimizedBrowserManager {
 
       this.connectionState.api = 'connected'
       
+      // Loaded lazily: module load and key-less runs never pay for the SDK
+      const Groq = require('groq-sdk')
+      
       // Initialize Groq client
       this.aiService = new Groq({
         apiKey: process.env.GROQ_API_KEY
@@ -419,15 +459,7 @@ ${browserAutomationResult.result?.success ?
           messages: [
             {
               role: 'system',
-              content: `You are KAiro AI, an advanced browser assistant with real browser automation capabilities.
-
-You have 6 specialized agents:
-- 🔍 Research Agent: Multi-source research and analysis
-- 🌐 Navigation Agent: Smart web navigation
-- 🛒 Shopping Agent: Product research and comparison  
-- 📧 Communication Agent: Email and message composition
-- 🤖 Automation Agent: Task automation and workflows
-- 📊 Analysis Agent: Content analysis and insights
+              content: `${AI_SYSTEM_PROMPT_HEADER}
 
 Current context: ${await this.getContextInfo()}
 
@@ -472,45 +504,11 @@ Respond helpfully about browser automation capabilities.`
   analyzeAgentTask(message) {
     const lowerMessage = message.toLowerCase()
     
-    const patterns = {
-      research: {
-        keywords: ['research', 'find', 'search', 'investigate', 'study', 'explore'],
-        confidence: 90
-      },
-      navigation: {
-        keywords: ['navigate', 'go to', 'visit', 'open', 'browse', 'website'],
-        confidence: 95
-      },
-      shopping: {
-        keywords: ['buy', 'purchase', 'shop', 'price', 'deal', 'product'],
-        confidence: 90
-      },
-      communication: {
-        keywords: ['email', 'write', 'compose', 'message', 'letter'],
-        confidence: 90
-      },
-      automation: {
-        keywords: ['automate', 'schedule', 'workflow', 'task', 'repeat'],
-        confidence: 90
-      },
-      analysis: {
-        keywords: ['analyze', 'review', 'examine', 'evaluate', 'assess'],
-        confidence: 90
-      }
-    }
-
     let bestMatch = { agent: 'research', confidence: 0 }
 
-    for (const [agent, pattern] of Object.entries(patterns)) {
-      let score = 0
-      let keywordMatches = 0
-
-      for (const keyword of pattern.keywords) {
-        if (lowerMessage.includes(keyword)) {
-          score += pattern.confidence
-          keywordMatches++
-        }
-      }
+    for (const [agent, pattern] of Object.entries(AGENT_TASK_PATTERNS)) {
+      const keywordMatches = pattern.keywords.filter(keyword => lowerMessage.includes(keyword)).length
+      const score = keywordMatches * pattern.confidence
 
       if (keywordMatches > 0) {
         const finalConfidence = Math.min(95, (score / pattern.keywords.length) * keywordMatches)
@@ -9,6 +9,73 @@ const path = require('path');
 console.log('🎯 KAiro Browser Final Assessment');
 console.log('=' .repeat(60));
 
+const MAIN_JS_PATH = '/app/electron/main.js';
+
+const CORE_SERVICES = Object.freeze([
+  { name: 'Database Service', path: '/app/src/backend/DatabaseService.js', weight: 4 },
+  { name: 'Agent Controller', path: '/app/src/core/agents/EnhancedAgentController.js', weight: 5 },
+  { name: 'Browser Automation', path: '/app/src/core/automation/BrowserAutomationEngine.js', weight: 5 },
+  { name: 'Performance Monitor', path: '/app/src/backend/AgentPerformanceMonitor.js', weight: 3 },
+  { name: 'Task Scheduler', path: '/app/src/backend/BackgroundTaskScheduler.js', weight: 3 },
+  { name: 'Data Extractor', path: '/app/src/core/automation/IntelligentDataExtractor.js', weight: 3 },
+  { name: 'Memory Optimizer', path: '/app/src/backend/MemoryOptimizer.js', weight: 2 }
+]);
+
+const EXPECTED_CONFIG_SECTIONS = Object.freeze(['browser', 'agents', 'database', 'automation', 'monitoring']);
+
+const EXPECTED_AGENTS = Object.freeze(['research', 'navigation', 'shopping', 'communication', 'automation', 'analysis']);
+
+const UI_COMPONENTS = Object.freeze([
+  { name: 'Main App', path: '/app/src/main/App.tsx', weight: 3 },
+  { name: 'AI Sidebar', path: '/app/src/main/components/AISidebar.tsx', weight: 2 },
+  { name: 'Browser Window', path: '/app/src/main/components/BrowserWindow.tsx', weight: 2 },
+  { name: 'Tab Bar', path: '/app/src/main/components/TabBar.tsx', weight: 2 },
+  { name: 'Navigation Bar', path: '/app/src/main/components/EnhancedNavigationBar.tsx', weight: 2 }
+]);
+
+const EXPECTED_AUTOMATION = Object.freeze(['BrowserAutomationEngine', 'IntelligentDataExtractor', 'InteractionSimulator', 'ResultCompiler']);
+
+const CRITICAL_FILES = Object.freeze([
+  MAIN_JS_PATH,
+  '/app/src/core/agents/EnhancedAgentController.js',
+  '/app/src/backend/DatabaseService.js'
+]);
+
+const DB_OPTIMIZATION_MARKERS = Object.freeze(['pragma', 'WAL', 'cache_size', 'mmap_size']);
+
+// Service markers looked up in main.js by the robustness and optimization checks
+const MAIN_JS_MARKERS = Object.freeze([
+  'serviceHealthCheck',
+  'healthMonitoring',
+  'startHealthMonitoring',
+  'before-quit',
+  'window-all-closed'
+]);
+
+// Grade bands in descending order; the final band catches everything below 75%
+const GRADE_BANDS = Object.freeze([
+  { min: 95, grade: 'A+', assessment: '🟢 EXCEPTIONAL - Perfectly optimized and robust application' },
+  { min: 90, grade: 'A', assessment: '🟢 EXCELLENT - Highly optimized with outstanding integration' },
+  { min: 85, grade: 'A-', assessment: '🟢 VERY GOOD - Well optimized with strong performance' },
+  { min: 80, grade: 'B+', assessment: '🟡 GOOD - Solid optimization with room for improvement' },
+  { min: 75, grade: 'B', assessment: '🟡 FAIR - Basic optimization, significant improvements needed' },
+  { min: -Infinity, grade: 'C', assessment: '🔴 NEEDS WORK - Major optimization and integration issues' }
+]);
+
+// Counts try and catch blocks in one pass
+function countErrorHandling(content) {
+  let tryCatchCount = 0;
+  let catchCount = 0;
+  for (const match of content.matchAll(/(try\s*{)|catch\s*\(/g)) {
+    if (match[1]) {
+      tryCatchCount++;
+    } else {
+      catchCount++;
+    }
+  }
+  return { tryCatchCount, catchCount };
+}
+
 class FinalAssessment {
   constructor() {
     this.scores = {
@@ -25,7 +92,41 @@ class FinalAssessment {
       robustness: 25,
       optimization: 25
     };
-    this.findings = [];
+    // Keyed by category so re-running an assessor replaces its finding instead of duplicating it
+    this.findings = new Map();
+    this.existsCache = new Map();
+    this.sourceCache = new Map();
+    this.jsonCache = new Map();
+    this.mainJsMarkers = null;
+  }
+
+  pathExists(filePath) {
+    if (!this.existsCache.has(filePath)) {
+      this.existsCache.set(filePath, fs.existsSync(filePath));
+    }
+    return this.existsCache.get(filePath);
+  }
+
+  readSource(filePath) {
+    if (!this.sourceCache.has(filePath)) {
+      this.sourceCache.set(filePath, fs.readFileSync(filePath, 'utf8'));
+    }
+    return this.sourceCache.get(filePath);
+  }
+
+  readJson(filePath) {
+    if (!this.jsonCache.has(filePath)) {
+      this.jsonCache.set(filePath, JSON.parse(this.readSource(filePath)));
+    }
+    return this.jsonCache.get(filePath);
+  }
+
+  getMainJsMarkers() {
+    if (!this.mainJsMarkers) {
+      const content = this.readSource(MAIN_JS_PATH);
+      this.mainJsMarkers = new Set(MAIN_JS_MARKERS.filter(marker => content.includes(marker)));
+    }
+    return this.mainJsMarkers;
   }
 
   async assessIntegration() {
@@ -33,20 +134,10 @@ class FinalAssessment {
     let score = 0;
 
     // Check core services exist and are properly integrated
-    const coreServices = [
-      { name: 'Database Service', path: '/app/src/backend/DatabaseService.js', weight: 4 },
-      { name: 'Agent Controller', path: '/app/src/core/agents/EnhancedAgentController.js', weight: 5 },
-      { name: 'Browser Automation', path: '/app/src/core/automation/BrowserAutomationEngine.js', weight: 5 },
-      { name: 'Performance Monitor', path: '/app/src/backend/AgentPerformanceMonitor.js', weight: 3 },
-      { name: 'Task Scheduler', path: '/app/src/backend/BackgroundTaskScheduler.js', weight: 3 },
-      { name: 'Data Extractor', path: '/app/src/core/automation/IntelligentDataExtractor.js', weight: 3 },
-      { name: 'Memory Optimizer', path: '/app/src/backend/MemoryOptimizer.js', weight: 2 }
-    ];
-
     console.log('📋 Checking core service integration:');
-    for (const service of coreServices) {
-      if (fs.existsSync(service.path)) {
-        const content = fs.readFileSync(service.path, 'utf8');
+    for (const service of CORE_SERVICES) {
+      if (this.pathExists(service.path)) {
+        const content = this.readSource(service.path);
         
         // Check for proper class exports
         const hasExport = content.includes('module.exports') || content.includes('export');
@@ -67,7 +158,7 @@ class FinalAssessment {
     }
 
     this.scores.integration = score;
-    this.findings.push(`Service Integration: ${score}/${this.maxScores.integration} points`);
+    this.findings.set('integration', `Service Integration: ${score}/${this.maxScores.integration} points`);
     console.log(`📊 Integration Score: ${score}/${this.maxScores.integration}`);
   }
 
@@ -76,15 +167,13 @@ class FinalAssessment {
     let score = 0;
 
     // Check performance configuration
-    if (fs.existsSync('/app/performance.config.json')) {
+    if (this.pathExists('/app/performance.config.json')) {
       score += 5;
       console.log('  ✅ Performance configuration file exists (5 points)');
       
-      const config = JSON.parse(fs.readFileSync('/app/performance.config.json', 'utf8'));
-      const expectedSections = ['browser', 'agents', 'database', 'automation', 'monitoring'];
-      
+      const config = this.readJson('/app/performance.config.json');
       let configScore = 0;
-      expectedSections.forEach(section => {
+      EXPECTED_CONFIG_SECTIONS.forEach(section => {
         if (config[section]) {
           configScore += 2;
           console.log(`    ✅ ${section} config present (2 points)`);
@@ -94,11 +183,11 @@ class FinalAssessment {
     }
 
     // Check build optimization
-    if (fs.existsSync('/app/dist')) {
+    if (this.pathExists('/app/dist')) {
       score += 3;
       console.log('  ✅ Production build created (3 points)');
       
-      const indexHtml = fs.readFileSync('/app/dist/index.html', 'utf8');
+      const indexHtml = this.readSource('/app/dist/index.html');
       if (indexHtml.includes('gzip')) {
         score += 2;
         console.log('  ✅ Build compression enabled (2 points)');
@@ -106,13 +195,13 @@ class FinalAssessment {
     }
 
     // Check memory optimization
-    if (fs.existsSync('/app/src/backend/MemoryOptimizer.js')) {
+    if (this.pathExists('/app/src/backend/MemoryOptimizer.js')) {
       score += 3;
       console.log('  ✅ Memory optimization system present (3 points)');
     }
 
     this.scores.performance = Math.min(score, this.maxScores.performance);
-    this.findings.push(`Performance Optimization: ${this.scores.performance}/${this.maxScores.performance} points`);
+    this.findings.set('performance', `Performance Optimization: ${this.scores.performance}/${this.maxScores.performance} points`);
     console.log(`📊 Performance Score: ${this.scores.performance}/${this.maxScores.performance}`);
   }
 
@@ -122,13 +211,12 @@ class FinalAssessment {
 
     // Check AI agents
     const agentControllerPath = '/app/src/core/agents/EnhancedAgentController.js';
-    if (fs.existsSync(agentControllerPath)) {
-      const content = fs.readFileSync(agentControllerPath, 'utf8');
+    if (this.pathExists(agentControllerPath)) {
+      const content = this.readSource(agentControllerPath);
       
-      const expectedAgents = ['research', 'navigation', 'shopping', 'communication', 'automation', 'analysis'];
       let agentScore = 0;
       
-      expectedAgents.forEach(agent => {
+      EXPECTED_AGENTS.forEach(agent => {
         if (content.includes(`${agent} agent`) || content.includes(`${agent}Agent`)) {
           agentScore += 2;
           console.log(`  ✅ ${agent.charAt(0).toUpperCase() + agent.slice(1)} Agent implemented (2 points)`);
@@ -138,17 +226,9 @@ class FinalAssessment {
     }
 
     // Check UI components
-    const uiComponents = [
-      { name: 'Main App', path: '/app/src/main/App.tsx', weight: 3 },
-      { name: 'AI Sidebar', path: '/app/src/main/components/AISidebar.tsx', weight: 2 },
-      { name: 'Browser Window', path: '/app/src/main/components/BrowserWindow.tsx', weight: 2 },
-      { name: 'Tab Bar', path: '/app/src/main/components/TabBar.tsx', weight: 2 },
-      { name: 'Navigation Bar', path: '/app/src/main/components/EnhancedNavigationBar.tsx', weight: 2 }
-    ];
-
     console.log('🎨 Checking UI component implementation:');
-    uiComponents.forEach(component => {
-      if (fs.existsSync(component.path)) {
+    UI_COMPONENTS.forEach(component => {
+      if (this.pathExists(component.path)) {
         score += component.weight;
         console.log(`  ✅ ${component.name}: Implemented (${component.weight} points)`);
       } else {
@@ -157,11 +237,9 @@ class FinalAssessment {
     });
 
     // Check automation features
-    if (fs.existsSync('/app/src/core/automation')) {
+    if (this.pathExists('/app/src/core/automation')) {
       const automationFiles = fs.readdirSync('/app/src/core/automation');
-      const expectedAutomation = ['BrowserAutomationEngine', 'IntelligentDataExtractor', 'InteractionSimulator', 'ResultCompiler'];
-      
-      expectedAutomation.forEach(feature => {
+      EXPECTED_AUTOMATION.forEach(feature => {
         const hasFeature = automationFiles.some(file => file.includes(feature));
         if (hasFeature) {
           score += 1;
@@ -171,7 +249,7 @@ class FinalAssessment {
     }
 
     this.scores.features = Math.min(score, this.maxScores.features);
-    this.findings.push(`Feature Implementation: ${this.scores.features}/${this.maxScores.features} points`);
+    this.findings.set('features', `Feature Implementation: ${this.scores.features}/${this.maxScores.features} points`);
     console.log(`📊 Features Score: ${this.scores.features}/${this.maxScores.features}`);
   }
 
@@ -180,20 +258,13 @@ class FinalAssessment {
     let score = 0;
 
     // Check error handling
-    const criticalFiles = [
-      '/app/electron/main.js',
-      '/app/src/core/agents/EnhancedAgentController.js',
-      '/app/src/backend/DatabaseService.js'
-    ];
-
     console.log('🛡️ Checking error handling implementation:');
-    criticalFiles.forEach(filePath => {
-      if (fs.existsSync(filePath)) {
-        const content = fs.readFileSync(filePath, 'utf8');
+    CRITICAL_FILES.forEach(filePath => {
+      if (this.pathExists(filePath)) {
+        const content = this.readSource(filePath);
         
         // Check for try-catch blocks
-        const tryCatchCount = (content.match(/try\s*{/g) || []).length;
-        const catchCount = (content.match(/catch\s*\(/g) || []).length;
+        const { tryCatchCount, catchCount } = countErrorHandling(content);
         
         if (tryCatchCount >= 2 && catchCount >= 2) {
           score += 3;
@@ -208,33 +279,33 @@ class FinalAssessment {
     });
 
     // Check for health monitoring
-    const mainJsContent = fs.readFileSync('/app/electron/main.js', 'utf8');
-    if (mainJsContent.includes('serviceHealthCheck') || mainJsContent.includes('healthMonitoring')) {
+    const mainJsMarkers = this.getMainJsMarkers();
+    if (mainJsMarkers.has('serviceHealthCheck') || mainJsMarkers.has('healthMonitoring')) {
       score += 5;
       console.log('  ✅ Health monitoring system present (5 points)');
     }
 
     // Check for graceful shutdown
-    if (mainJsContent.includes('before-quit') || mainJsContent.includes('window-all-closed')) {
+    if (mainJsMarkers.has('before-quit') || mainJsMarkers.has('window-all-closed')) {
       score += 3;
       console.log('  ✅ Graceful shutdown handling present (3 points)');
     }
 
     // Check for backup/recovery mechanisms
-    const dbServiceContent = fs.readFileSync('/app/src/backend/DatabaseService.js', 'utf8');
+    const dbServiceContent = this.readSource('/app/src/backend/DatabaseService.js');
     if (dbServiceContent.includes('backup') || dbServiceContent.includes('recovery')) {
       score += 2;
       console.log('  ✅ Backup/recovery mechanisms present (2 points)');
     }
 
     // Check environment variable validation
-    if (fs.existsSync('/app/.env')) {
+    if (this.pathExists('/app/.env')) {
       score += 2;
       console.log('  ✅ Environment configuration present (2 points)');
     }
 
     this.scores.robustness = Math.min(score, this.maxScores.robustness);
-    this.findings.push(`System Robustness: ${this.scores.robustness}/${this.maxScores.robustness} points`);
+    this.findings.set('robustness', `System Robustness: ${this.scores.robustness}/${this.maxScores.robustness} points`);
     console.log(`📊 Robustness Score: ${this.scores.robustness}/${this.maxScores.robustness}`);
   }
 
@@ -243,22 +314,15 @@ class FinalAssessment {
     let score = 0;
 
     // Check lazy loading implementation
-    const appTsxContent = fs.readFileSync('/app/src/main/App.tsx', 'utf8');
+    const appTsxContent = this.readSource('/app/src/main/App.tsx');
     if (appTsxContent.includes('React.lazy') || appTsxContent.includes('Suspense')) {
       score += 5;
       console.log('  ✅ Lazy loading implemented (5 points)');
     }
 
     // Check database optimization
-    const dbContent = fs.readFileSync('/app/src/backend/DatabaseService.js', 'utf8');
-    const dbOptimizations = ['pragma', 'WAL', 'cache_size', 'mmap_size'];
-    let dbOptScore = 0;
-    
-    dbOptimizations.forEach(opt => {
-      if (dbContent.includes(opt)) {
-        dbOptScore += 1;
-      }
-    });
+    const dbContent = this.readSource('/app/src/backend/DatabaseService.js');
+    const dbOptScore = DB_OPTIMIZATION_MARKERS.filter(marker => dbContent.includes(marker)).length;
     
     if (dbOptScore >= 3) {
       score += 5;
@@ -269,104 +333,95 @@ class FinalAssessment {
     }
 
     // Check agent performance optimization
-    const agentContent = fs.readFileSync('/app/src/core/agents/EnhancedAgentController.js', 'utf8');
+    const agentContent = this.readSource('/app/src/core/agents/EnhancedAgentController.js');
     if (agentContent.includes('optimizeAgentPerformance') || agentContent.includes('performanceConfig')) {
       score += 5;
       console.log('  ✅ Agent performance optimization implemented (5 points)');
     }
 
     // Check memory optimization
-    if (fs.existsSync('/app/src/backend/MemoryOptimizer.js')) {
+    if (this.pathExists('/app/src/backend/MemoryOptimizer.js')) {
       score += 5;
       console.log('  ✅ Memory optimization system created (5 points)');
     }
 
     // Check service coordination optimization
-    const mainContent = fs.readFileSync('/app/electron/main.js', 'utf8');
-    if (mainContent.includes('serviceHealthCheck') && mainContent.includes('startHealthMonitoring')) {
+    const mainJsMarkers = this.getMainJsMarkers();
+    if (mainJsMarkers.has('serviceHealthCheck') && mainJsMarkers.has('startHealthMonitoring')) {
       score += 5;
       console.log('  ✅ Service coordination optimization implemented (5 points)');
     }
 
     this.scores.optimization = Math.min(score, this.maxScores.optimization);
-    this.findings.push(`Optimization Implementation: ${this.scores.optimization}/${this.maxScores.optimization} points`);
+    this.findings.set('optimization', `Optimization Implementation: ${this.scores.optimization}/${this.maxScores.optimization} points`);
     console.log(`📊 Optimization Score: ${this.scores.optimization}/${this.maxScores.optimization}`);
   }
 
   calculateOverallScore() {
-    const totalScore = Object.values(this.scores).reduce((sum, score) => sum + score, 0);
-    const maxTotalScore = Object.values(this.maxScores).reduce((sum, score) => sum + score, 0);
+    // One pass over the categories accumulates both totals and the per-category breakdown
+    let totalScore = 0;
+    let maxTotalScore = 0;
+    const categories = [];
+    for (const category in this.scores) {
+      const score = this.scores[category];
+      const maxScore = this.maxScores[category];
+      totalScore += score;
+      maxTotalScore += maxScore;
+      categories.push({ category, score, maxScore, percentage: (score / maxScore * 100).toFixed(1) });
+    }
     const percentage = (totalScore / maxTotalScore * 100).toFixed(1);
     
-    return { totalScore, maxTotalScore, percentage };
+    return { totalScore, maxTotalScore, percentage, categories };
   }
 
   generateFinalReport() {
     const overall = this.calculateOverallScore();
     
-    console.log('\n' + '='.repeat(60));
-    console.log('🎯 FINAL ASSESSMENT REPORT');
-    console.log('='.repeat(60));
+    const lines = [
+      '\n' + '='.repeat(60),
+      '🎯 FINAL ASSESSMENT REPORT',
+      '='.repeat(60)
+    ];
     
-    console.log('\n📊 DETAILED SCORES:');
-    Object.keys(this.scores).forEach(category => {
-      const score = this.scores[category];
-      const maxScore = this.maxScores[category];
-      const percentage = (score / maxScore * 100).toFixed(1);
-      console.log(`  📈 ${category.charAt(0).toUpperCase() + category.slice(1)}: ${score}/${maxScore} (${percentage}%)`);
+    lines.push('\n📊 DETAILED SCORES:');
+    overall.categories.forEach(({ category, score, maxScore, percentage }) => {
+      lines.push(`  📈 ${category.charAt(0).toUpperCase() + category.slice(1)}: ${score}/${maxScore} (${percentage}%)`);
     });
     
-    console.log(`\n🏆 OVERALL SCORE: ${overall.totalScore}/${overall.maxTotalScore} (${overall.percentage}%)`);
+    lines.push(`\n🏆 OVERALL SCORE: ${overall.totalScore}/${overall.maxTotalScore} (${overall.percentage}%)`);
     
-    // Grade assignment
-    let grade, assessment;
-    if (overall.percentage >= 95) {
-      grade = 'A+';
-      assessment = '🟢 EXCEPTIONAL - Perfectly optimized and robust application';
-    } else if (overall.percentage >= 90) {
-      grade = 'A';
-      assessment = '🟢 EXCELLENT - Highly optimized with outstanding integration';
-    } else if (overall.percentage >= 85) {
-      grade = 'A-';
-      assessment = '🟢 VERY GOOD - Well optimized with strong performance';
-    } else if (overall.percentage >= 80) {
-      grade = 'B+';
-      assessment = '🟡 GOOD - Solid optimization with room for improvement';
-    } else if (overall.percentage >= 75) {
-      grade = 'B';
-      assessment = '🟡 FAIR - Basic optimization, significant improvements needed';
-    } else {
-      grade = 'C';
-      assessment = '🔴 NEEDS WORK - Major optimization and integration issues';
-    }
+    // Grade assignment - first band whose threshold the percentage reaches
+    const { grade, assessment } = GRADE_BANDS.find(band => overall.percentage >= band.min) ||
+      GRADE_BANDS[GRADE_BANDS.length - 1];
     
-    console.log(`\n🎖️ GRADE: ${grade}`);
-    console.log(`🎯 ASSESSMENT: ${assessment}`);
+    lines.push(`\n🎖️ GRADE: ${grade}`);
+    lines.push(`🎯 ASSESSMENT: ${assessment}`);
     
-    console.log('\n✨ KEY ACHIEVEMENTS:');
-    this.findings.forEach(finding => console.log(`  • ${finding}`));
+    lines.push('\n✨ KEY ACHIEVEMENTS:');
+    this.findings.forEach(finding => lines.push(`  • ${finding}`));
     
-    console.log('\n🚀 PERFORMANCE CHARACTERISTICS:');
-    console.log('  • 6 AI agents fully integrated and operational');
-    console.log('  • Complete browser automation system');
-    console.log('  • Advanced data extraction and processing');
-    console.log('  • Comprehensive performance monitoring');
-    console.log('  • Robust error handling and recovery');
-    console.log('  • Memory optimization and cleanup systems');
-    console.log('  • Service health monitoring and coordination');
+    lines.push('\n🚀 PERFORMANCE CHARACTERISTICS:');
+    lines.push('  • 6 AI agents fully integrated and operational');
+    lines.push('  • Complete browser automation system');
+    lines.push('  • Advanced data extraction and processing');
+    lines.push('  • Comprehensive performance monitoring');
+    lines.push('  • Robust error handling and recovery');
+    lines.push('  • Memory optimization and cleanup systems');
+    lines.push('  • Service health monitoring and coordination');
     
-    console.log('\n🎉 CONCLUSION:');
+    lines.push('\n🎉 CONCLUSION:');
     if (overall.percentage >= 85) {
-      console.log('✅ KAiro Browser is highly optimized, well-integrated, and robust!');
-      console.log('🚀 Ready for production use with exceptional performance characteristics.');
+      lines.push('✅ KAiro Browser is highly optimized, well-integrated, and robust!');
+      lines.push('🚀 Ready for production use with exceptional performance characteristics.');
     } else if (overall.percentage >= 75) {
-      console.log('✅ KAiro Browser is well-functioning with good optimization.');
-      console.log('⚡ Some areas could benefit from additional fine-tuning.');
+      lines.push('✅ KAiro Browser is well-functioning with good optimization.');
+      lines.push('⚡ Some areas could benefit from additional fine-tuning.');
     } else {
-      console.log('⚠️ KAiro Browser has basic functionality but needs optimization work.');
-      console.log('🔧 Focus on integration and performance improvements recommended.');
+      lines.push('⚠️ KAiro Browser has basic functionality but needs optimization work.');
+      lines.push('🔧 Focus on integration and performance improvements recommended.');
     }
     
+    console.log(lines.join('\n'));
     return { grade, percentage: overall.percentage, assessment };
   }
 
@@ -393,13 +448,15 @@ async function main() {
     timestamp: new Date().toISOString(),
     scores: assessment.scores,
     maxScores: assessment.maxScores,
-    findings: assessment.findings,
+    findings: Array.from(assessment.findings.values()),
     grade: result.grade,
     percentage: result.percentage,
     assessment: result.assessment
   };
   
-  fs.writeFileSync('/app/assessment_report.json', JSON.stringify(reportData, null, 2));
+  // Compact by default; set KAIRO_PRETTY=1 for an indented, human-readable file
+  const indent = process.env.KAIRO_PRETTY === '1' ? 2 : undefined;
+  fs.writeFileSync('/app/assessment_report.json', JSON.stringify(reportData, null, indent));
   console.log('\n💾 Assessment report saved to assessment_report.json');
   
   return result;
@@ -37,22 +37,27 @@ class AgentPerformanceMonitor {
       // Save metric to database
       await this.db.savePerformanceMetric(metric);
       
+      // One read serves both checks (health uses the newest 10 of these 20)
+      const recentMetrics = await this.db.getPerformanceMetrics(metric.agentId, 20);
+      
       // Update agent health status
-      await this.updateAgentHealth(metric.agentId, metric);
+      await this.updateAgentHealth(metric.agentId, metric, recentMetrics.slice(0, 10));
       
       // Check if optimization is needed
-      await this.checkForOptimizationNeeds(metric.agentId);
+      await this.checkForOptimizationNeeds(metric.agentId, recentMetrics);
       
     } catch (error) {
       console.error('❌ Failed to record performance metric:', error);
     }
   }
 
-  async updateAgentHealth(agentId, metric) {
+  async updateAgentHealth(agentId, metric, recentMetrics = null) {
     const now = Date.now();
     
     // Calculate new health metrics
-    const recentMetrics = await this.db.getPerformanceMetrics(agentId, 10);
+    if (!recentMetrics) {
+      recentMetrics = await this.db.getPerformanceMetrics(agentId, 10);
+    }
     const successRate = recentMetrics.filter(m => m.success).length / recentMetrics.length;
     const errorRate = 1 - successRate;
     const avgResponseTime = recentMetrics.reduce((sum, m) => sum + m.duration, 0) / recentMetrics.length;
@@ -124,15 +129,13 @@ class AgentPerformanceMonitor {
   async calculateSuccessRate(agentId, timeWindow = 24 * 60 * 60 * 1000) { // 24 hours default
     try {
       const cutoffTime = Date.now() - timeWindow;
-      const metrics = await this.db.getPerformanceMetrics(agentId, 1000);
-      const recentMetrics = metrics.filter(m => m.startTime > cutoffTime);
+      const { totalTasks, successfulTasks } = await this.db.getPerformanceSummary(agentId, cutoffTime);
       
-      if (recentMetrics.length === 0) return 1.0; // No data = perfect score
+      if (totalTasks === 0) return 1.0; // No data = perfect score
       
-      const successfulTasks = recentMetrics.filter(m => m.success).length;
-      const successRate = successfulTasks / recentMetrics.length;
+      const successRate = successfulTasks / totalTasks;
       
-      console.log(`📈 Agent ${agentId} success rate: ${(successRate * 100).toFixed(1)}% (${successfulTasks}/${recentMetrics.length} tasks)`);
+      console.log(`📈 Agent ${agentId} success rate: ${(successRate * 100).toFixed(1)}% (${successfulTasks}/${totalTasks} tasks)`);
       return successRate;
     } catch (error) {
       console.error(`❌ Failed to calculate success rate for ${agentId}:`, error);
@@ -188,8 +191,10 @@ class AgentPerformanceMonitor {
     }
   }
 
-  async checkForOptimizationNeeds(agentId) {
-    const recentMetrics = await this.db.getPerformanceMetrics(agentId, 20);
+  async checkForOptimizationNeeds(agentId, recentMetrics = null) {
+    if (!recentMetrics) {
+      recentMetrics = await this.db.getPerformanceMetrics(agentId, 20);
+    }
     
     if (recentMetrics.length < 5) return; // Need enough data
     
@@ -235,10 +240,9 @@ class AgentPerformanceMonitor {
 
   async getPerformanceStats(agentId, days = 7) {
     const cutoffTime = Date.now() - (days * 24 * 60 * 60 * 1000);
-    const metrics = await this.db.getPerformanceMetrics(agentId, 1000);
-    const recentMetrics = metrics.filter(m => m.startTime > cutoffTime);
+    const { totalTasks, successfulTasks, averageDuration } = await this.db.getPerformanceSummary(agentId, cutoffTime);
     
-    if (recentMetrics.length === 0) {
+    if (totalTasks === 0) {
       return {
         totalTasks: 0,
         successRate: 0,
@@ -248,15 +252,13 @@ class AgentPerformanceMonitor {
       };
     }
     
-    const successfulTasks = recentMetrics.filter(m => m.success).length;
-    const successRate = successfulTasks / recentMetrics.length;
-    const averageResponseTime = recentMetrics.reduce((sum, m) => sum + m.duration, 0) / recentMetrics.length;
+    const successRate = successfulTasks / totalTasks;
     const errorRate = 1 - successRate;
     
     return {
-      totalTasks: recentMetrics.length,
+      totalTasks,
       successRate,
-      averageResponseTime,
+      averageResponseTime: averageDuration,
       errorRate,
       performanceTrend: 'stable'
     };
@@ -77,13 +77,14 @@ class BackgroundTaskScheduler {
       throw new Error(`Unknown task type: ${type}`);
     }
 
+    const now = Date.now();
     const task = {
-      id: `task_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+      id: `task_${now}_${Math.random().toString(36).substr(2, 9)}`,
       type,
       priority: options.priority || 5,
       status: 'pending',
       payload,
-      createdAt: Date.now(),
+      createdAt: now,
       scheduledFor: options.scheduledFor,
       retryCount: 0,
       maxRetries: options.maxRetries || taskType.defaultMaxRetries,
@@ -116,11 +117,16 @@ class BackgroundTaskScheduler {
   async resumePendingTasks() {
     // Resume tasks that were running when the system shut down
     const runningTasks = await this.db.getBackgroundTasks('running');
+    if (runningTasks.length === 0) return;
     
+    // Reset running tasks to pending for retry
     for (const task of runningTasks) {
-      // Reset running tasks to pending for retry
       task.status = 'pending';
-      await this.db.saveBackgroundTask(task);
+    }
+    
+    await this.db.saveBackgroundTasks(runningTasks);
+    
+    for (const task of runningTasks) {
       console.log(`🔄 Resumed pending task: ${task.id}`);
     }
   }
@@ -188,7 +194,7 @@ class BackgroundTaskScheduler {
         if (task.retryCount < task.maxRetries) {
           task.retryCount++;
           task.status = 'pending';
-          task.scheduledFor = Date.now() + (task.retryCount * 60000); // Exponential backoff
+          task.scheduledFor = task.completedAt + (task.retryCount * 60000); // Exponential backoff from the completion timestamp
           console.log(`🔄 Task ${task.id} failed, scheduling retry ${task.retryCount}/${task.maxRetries}`);
         } else {
           console.log(`❌ Task ${task.id} failed permanently after ${task.maxRetries} retries`);
@@ -210,7 +216,7 @@ class BackgroundTaskScheduler {
       if (task.retryCount < task.maxRetries) {
         task.retryCount++;
         task.status = 'pending';
-        task.scheduledFor = Date.now() + (task.retryCount * 60000);
+        task.scheduledFor = task.completedAt + (task.retryCount * 60000);
       }
       
       await this.db.saveBackgroundTask(task);
@@ -351,8 +357,7 @@ class BackgroundTaskScheduler {
   }
 
   async getTaskStatus(taskId) {
-    const tasks = await this.db.getBackgroundTasks();
-    return tasks.find(task => task.id === taskId) || null;
+    return this.db.getBackgroundTask(taskId);
   }
 
   async getTasksByType(type, limit = 50) {
@@ -361,14 +366,15 @@ class BackgroundTaskScheduler {
   }
 
   async getTaskStats() {
-    const allTasks = await this.db.getBackgroundTasks(undefined, 1000);
+    const counts = await this.db.getBackgroundTaskCounts();
+    const totalTasks = Object.values(counts).reduce((sum, count) => sum + count, 0);
     
     return {
-      pending: allTasks.filter(t => t.status === 'pending').length,
-      running: allTasks.filter(t => t.status === 'running').length,
-      completed: allTasks.filter(t => t.status === 'completed').length,
-      failed: allTasks.filter(t => t.status === 'failed').length,
-      totalTasks: allTasks.length
+      pending: counts.pending || 0,
+      running: counts.running || 0,
+      completed: counts.completed || 0,
+      failed: counts.failed || 0,
+      totalTasks
     };
   }
 
@@ -378,35 +384,13 @@ class BackgroundTaskScheduler {
       console.log('⚡ Optimizing task scheduling algorithm...');
       
       const stats = await this.getTaskStats();
-      const allTasks = await this.db.getBackgroundTasks(undefined, 1000);
       
       // Analyze task performance patterns
-      const taskTypePerformance = new Map();
-      
-      for (const task of allTasks) {
-        if (!taskTypePerformance.has(task.type)) {
-          taskTypePerformance.set(task.type, {
-            total: 0,
-            successful: 0,
-            avgDuration: 0,
-            totalDuration: 0
-          });
-        }
-        
-        const perf = taskTypePerformance.get(task.type);
-        perf.total++;
-        
-        if (task.status === 'completed') {
-          perf.successful++;
-          if (task.completedAt && task.startedAt) {
-            const duration = task.completedAt - task.startedAt;
-            perf.totalDuration += duration;
-          }
-        }
-      }
+      const typeStats = await this.db.getBackgroundTaskTypeStats();
       
       // Update task type priorities based on performance
-      for (const [type, perf] of taskTypePerformance.entries()) {
+      for (const perf of typeStats) {
+        const type = perf.type;
         const successRate = perf.total > 0 ? perf.successful / perf.total : 1;
         perf.avgDuration = perf.successful > 0 ? perf.totalDuration / perf.successful : 30000;
         
@@ -5,41 +5,90 @@ const Database = require('better-sqlite3');
 const fs = require('fs');
 const path = require('path');
 
+const BACKGROUND_TASK_COLUMNS = [
+  'id', 'type', 'priority', 'status', 'payload', 'created_at', 'scheduled_for',
+  'started_at', 'completed_at', 'retry_count', 'max_retries', 'last_error', 'agent_id'
+];
+
+// Shared by the single and batch task writers
+const SAVE_BACKGROUND_TASK_SQL = `INSERT OR REPLACE INTO background_tasks (${BACKGROUND_TASK_COLUMNS.join(', ')}) VALUES (${BACKGROUND_TASK_COLUMNS.map(() => '?').join(', ')})`;
+
+// Positional parameters for SAVE_BACKGROUND_TASK_SQL, in BACKGROUND_TASK_COLUMNS order
+function toBackgroundTaskRow(task) {
+  return [
+    task.id,
+    task.type,
+    task.priority,
+    task.status,
+    JSON.stringify(task.payload),
+    task.createdAt,
+    task.scheduledFor,
+    task.startedAt,
+    task.completedAt,
+    task.retryCount,
+    task.maxRetries,
+    task.lastError,
+    task.agentId
+  ];
+}
+
 class DatabaseService {
   constructor(config) {
     this.db = null;
     this.config = config;
+    this.statements = new Map();
   }
 
   async initialize() {
     try {
       console.log('🗄️ Initializing Database Service (Backend Only)...');
       
-      // Ensure data directory exists
-      const dbDir = path.dirname(this.config.path);
-      if (!fs.existsSync(dbDir)) {
-        fs.mkdirSync(dbDir, { recursive: true });
-      }
+      // Ensure data directory exists (recursive mkdir is a no-op when it does)
+      fs.mkdirSync(path.dirname(this.config.path), { recursive: true });
 
       // Initialize SQLite database
       this.db = new Database(this.config.path);
-      this.db.pragma('journal_mode = WAL');
-      this.db.pragma('synchronous = NORMAL');
-      this.db.pragma('cache_size = 1000');
-      this.db.pragma('temp_store = MEMORY');
-
-      // Create all tables
-      await this.createTables();
-      await this.createIndexes();
-      
       this.optimizeQueries();
-    console.log('✅ Database Service initialized successfully');
+
+      // Create all tables and indexes in one transaction (single journal commit)
+      this.db.exec('BEGIN');
+      try {
+        await this.createTables();
+        await this.createIndexes();
+        this.db.exec('COMMIT');
+      } catch (error) {
+        this.db.exec('ROLLBACK');
+        throw error;
+      }
+
+      console.log('✅ Database Service initialized successfully');
     } catch (error) {
       console.error('❌ Failed to initialize Database Service:', error);
       throw error;
     }
   }
 
+  optimizeQueries() {
+    if (!this.db) throw new Error('Database not initialized');
+
+    // Connection-level tuning: WAL journaling, 64MB page cache, 256MB mmap window
+    this.db.pragma('journal_mode = WAL');
+    this.db.pragma('synchronous = NORMAL');
+    this.db.pragma('cache_size = -65536');
+    this.db.pragma('temp_store = MEMORY');
+    this.db.pragma('mmap_size = 268435456');
+  }
+
+  // Prepared statements are compiled once per SQL string and reused
+  prepare(sql) {
+    let stmt = this.statements.get(sql);
+    if (!stmt) {
+      stmt = this.db.prepare(sql);
+      this.statements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
   async createTables() {
     if (!this.db) throw new Error('Database not initialized');
 
@@ -163,10 +212,10 @@ class DatabaseService {
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_memory_created ON agent_memory(created_at DESC)');
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_memory_expires ON agent_memory(expires_at)');
     
-    this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_performance_agent ON agent_performance(agent_id)');
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_performance_start ON agent_performance(start_time DESC)');
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_performance_success ON agent_performance(success)');
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_performance_task_type ON agent_performance(task_type)');
+    this.db.exec('CREATE INDEX IF NOT EXISTS idx_agent_performance_agent_start ON agent_performance(agent_id, start_time DESC)');
     
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_background_tasks_status ON background_tasks(status)');
     this.db.exec('CREATE INDEX IF NOT EXISTS idx_background_tasks_priority ON background_tasks(priority DESC)');
@@ -221,7 +270,7 @@ class DatabaseService {
     searchQuery += ' ORDER BY updated_at DESC LIMIT ?';
     searchParams.push(limit);
     
-    const stmt = this.db.prepare(searchQuery);
+    const stmt = this.prepare(searchQuery);
     const rows = stmt.all(...searchParams);
     
     return rows.map(row => ({
@@ -241,22 +290,23 @@ class DatabaseService {
   async saveBookmark(bookmark) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT OR REPLACE INTO bookmarks 
       (id, title, url, description, tags, created_at, updated_at, visit_count, last_visited, favicon, category)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     `);
     
+    const now = Date.now();
     stmt.run(
       bookmark.id,
       bookmark.title,
       bookmark.url,
       bookmark.description,
       JSON.stringify(bookmark.tags || []),
-      bookmark.createdAt || Date.now(),
-      bookmark.updatedAt || Date.now(),
+      bookmark.createdAt || now,
+      bookmark.updatedAt || now,
       bookmark.visitCount || 0,
-      bookmark.lastVisited || Date.now(),
+      bookmark.lastVisited || now,
       bookmark.favicon || null,
       bookmark.category || 'general'
     );
@@ -265,7 +315,7 @@ class DatabaseService {
   async getBookmarks(limit = 100) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare('SELECT * FROM bookmarks ORDER BY updated_at DESC LIMIT ?');
+    const stmt = this.prepare('SELECT * FROM bookmarks ORDER BY updated_at DESC LIMIT ?');
     const rows = stmt.all(limit);
     
     return rows.map(row => ({
@@ -287,7 +337,7 @@ class DatabaseService {
   async saveHistoryEntry(entry) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO history 
       (id, url, title, visited_at, duration, page_type, exit_type, referrer, search_query)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -309,7 +359,7 @@ class DatabaseService {
   async getHistory(limit = 100) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare('SELECT * FROM history ORDER BY visited_at DESC LIMIT ?');
+    const stmt = this.prepare('SELECT * FROM history ORDER BY visited_at DESC LIMIT ?');
     const rows = stmt.all(limit);
     
     return rows.map(row => ({
@@ -329,7 +379,7 @@ class DatabaseService {
   async saveAgentMemory(memory) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT OR REPLACE INTO agent_memory 
       (id, agent_id, type, content, importance, tags, created_at, expires_at, related_memories, metadata)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -372,7 +422,7 @@ class DatabaseService {
       params.push(options.limit);
     }
     
-    const stmt = this.db.prepare(query);
+    const stmt = this.prepare(query);
     const rows = stmt.all(...params);
     
     return rows.map(row => ({
@@ -393,7 +443,7 @@ class DatabaseService {
   async savePerformanceMetric(metric) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO agent_performance 
       (id, agent_id, task_type, start_time, end_time, duration, success, error_message, resource_usage, quality_score, metadata)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -417,7 +467,7 @@ class DatabaseService {
   async getPerformanceMetrics(agentId, limit = 100) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       SELECT * FROM agent_performance 
       WHERE agent_id = ? 
       ORDER BY start_time DESC 
@@ -440,31 +490,51 @@ class DatabaseService {
     }));
   }
 
+  async getPerformanceSummary(agentId, since, limit = 1000) {
+    if (!this.db) throw new Error('Database not initialized');
+    
+    // Aggregate the agent's most recent metrics
+    const stmt = this.prepare(`
+      SELECT COUNT(*) AS total, SUM(success) AS successful, AVG(duration) AS avg_duration
+      FROM (
+        SELECT success, duration FROM agent_performance
+        WHERE agent_id = ? AND start_time > ?
+        ORDER BY start_time DESC
+        LIMIT ?
+      )
+    `);
+    const row = stmt.get(agentId, since, limit);
+    
+    return {
+      totalTasks: row.total,
+      successfulTasks: row.successful || 0,
+      averageDuration: row.avg_duration || 0
+    };
+  }
+
   // Background Task Operations
   async saveBackgroundTask(task) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare(`
-      INSERT OR REPLACE INTO background_tasks 
-      (id, type, priority, status, payload, created_at, scheduled_for, started_at, completed_at, retry_count, max_retries, last_error, agent_id)
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    `);
+    const stmt = this.prepare(SAVE_BACKGROUND_TASK_SQL);
     
-    stmt.run(
-      task.id,
-      task.type,
-      task.priority,
-      task.status,
-      JSON.stringify(task.payload),
-      task.createdAt,
-      task.scheduledFor,
-      task.startedAt,
-      task.completedAt,
-      task.retryCount,
-      task.maxRetries,
-      task.lastError,
-      task.agentId
-    );
+    stmt.run(toBackgroundTaskRow(task));
+  }
+
+  async saveBackgroundTasks(tasks) {
+    if (!this.db) throw new Error('Database not initialized');
+    
+    const stmt = this.prepare(SAVE_BACKGROUND_TASK_SQL);
+    
+    // One prepared statement, one transaction for the whole batch
+    const insertMany = this.db.transaction((rows) => {
+      for (const task of rows) {
+        stmt.run(toBackgroundTaskRow(task));
+      }
+    });
+    
+    insertMany(tasks);
+    return tasks.length;
   }
 
   async getBackgroundTasks(status, limit = 100) {
@@ -481,10 +551,21 @@ class DatabaseService {
     query += ' ORDER BY priority DESC, created_at ASC LIMIT ?';
     params.push(limit);
     
-    const stmt = this.db.prepare(query);
+    const stmt = this.prepare(query);
     const rows = stmt.all(...params);
     
-    return rows.map(row => ({
+    return rows.map(row => this.mapBackgroundTaskRow(row));
+  }
+
+  async getBackgroundTask(taskId) {
+    if (!this.db) throw new Error('Database not initialized');
+    
+    const row = this.prepare('SELECT * FROM background_tasks WHERE id = ?').get(taskId);
+    return row ? this.mapBackgroundTaskRow(row) : null;
+  }
+
+  mapBackgroundTaskRow(row) {
+    return {
       id: row.id,
       type: row.type,
       priority: row.priority,
@@ -498,6 +579,41 @@ class DatabaseService {
       maxRetries: row.max_retries,
       lastError: row.last_error,
       agentId: row.agent_id
+    };
+  }
+
+  async getBackgroundTaskCounts() {
+    if (!this.db) throw new Error('Database not initialized');
+    
+    const stmt = this.prepare('SELECT status, COUNT(*) AS count FROM background_tasks GROUP BY status');
+    const rows = stmt.all();
+    
+    const counts = {};
+    rows.forEach(row => {
+      counts[row.status] = row.count;
+    });
+    
+    return counts;
+  }
+
+  async getBackgroundTaskTypeStats() {
+    if (!this.db) throw new Error('Database not initialized');
+    
+    const stmt = this.prepare(`
+      SELECT type,
+        COUNT(*) AS total,
+        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS successful,
+        SUM(CASE WHEN status = 'completed' AND completed_at AND started_at
+          THEN completed_at - started_at ELSE 0 END) AS total_duration
+      FROM background_tasks
+      GROUP BY type
+    `);
+    
+    return stmt.all().map(row => ({
+      type: row.type,
+      total: row.total,
+      successful: row.successful,
+      totalDuration: row.total_duration
     }));
   }
 
@@ -506,7 +622,7 @@ class DatabaseService {
     if (!this.db) throw new Error('Database not initialized');
     
     const now = Date.now();
-    const stmt = this.db.prepare('DELETE FROM agent_memory WHERE expires_at IS NOT NULL AND expires_at < ?');
+    const stmt = this.prepare('DELETE FROM agent_memory WHERE expires_at IS NOT NULL AND expires_at < ?');
     const result = stmt.run(now);
     
     console.log(`🧹 Cleaned up ${result.changes} expired memories`);
@@ -517,7 +633,7 @@ class DatabaseService {
     if (!this.db) throw new Error('Database not initialized');
     
     const cutoffTime = Date.now() - (daysToKeep * 24 * 60 * 60 * 1000);
-    const stmt = this.db.prepare('DELETE FROM history WHERE visited_at < ?');
+    const stmt = this.prepare('DELETE FROM history WHERE visited_at < ?');
     const result = stmt.run(cutoffTime);
     
     console.log(`🧹 Cleaned up ${result.changes} old history entries`);
@@ -533,7 +649,7 @@ class DatabaseService {
     const dataType = this.inferDataType(value);
     const serializedValue = this.serializeConfigValue(value, dataType);
     
-    const stmt = this.db.prepare(`
+    const stmt = this.prepare(`
       INSERT OR REPLACE INTO system_config 
       (key, value, type, data_type, updated_at, category)
       VALUES (?, ?, ?, ?, ?, ?)
@@ -547,7 +663,7 @@ class DatabaseService {
   async getSystemConfig(key, defaultValue = null) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare('SELECT * FROM system_config WHERE key = ?');
+    const stmt = this.prepare('SELECT * FROM system_config WHERE key = ?');
     const row = stmt.get(key);
     
     if (!row) {
@@ -570,7 +686,7 @@ class DatabaseService {
     
     query += ' ORDER BY category, key';
     
-    const stmt = this.db.prepare(query);
+    const stmt = this.prepare(query);
     const rows = stmt.all(...params);
     
     const config = {};
@@ -590,7 +706,7 @@ class DatabaseService {
   async deleteSystemConfig(key) {
     if (!this.db) throw new Error('Database not initialized');
     
-    const stmt = this.db.prepare('DELETE FROM system_config WHERE key = ?');
+    const stmt = this.prepare('DELETE FROM system_config WHERE key = ?');
     const result = stmt.run(key);
     
     console.log(`🗑️ System config deleted: ${key}`);
@@ -639,6 +755,7 @@ class DatabaseService {
 
   async close() {
     if (this.db) {
+      this.statements.clear();
       this.db.close();
       this.db = null;
       console.log('✅ Database connection closed');
@@ -259,17 +259,18 @@ class EnhancedResearchAgent {
 
   identifyResearchSources(task, context) {
     const sources = ['google', 'wikipedia'];
+    const lowerTask = task.toLowerCase();
     
     // Add specialized sources based on topic
-    if (task.toLowerCase().includes('academic') || task.toLowerCase().includes('paper')) {
+    if (lowerTask.includes('academic') || lowerTask.includes('paper')) {
       sources.push('scholar');
     }
     
-    if (task.toLowerCase().includes('news') || task.toLowerCase().includes('current')) {
+    if (lowerTask.includes('news') || lowerTask.includes('current')) {
       sources.push('news');
     }
     
-    if (task.toLowerCase().includes('tech') || task.toLowerCase().includes('programming')) {
+    if (lowerTask.includes('tech') || lowerTask.includes('programming')) {
       sources.push('github', 'stackoverflow');
     }
 
@@ -277,9 +278,10 @@ class EnhancedResearchAgent {
   }
 
   determineAnalysisType(task) {
-    if (task.toLowerCase().includes('sentiment')) return 'sentiment';
-    if (task.toLowerCase().includes('trend')) return 'trends';
-    if (task.toLowerCase().includes('compare')) return 'comparison';
+    const lowerTask = task.toLowerCase();
+    if (lowerTask.includes('sentiment')) return 'sentiment';
+    if (lowerTask.includes('trend')) return 'trends';
+    if (lowerTask.includes('compare')) return 'comparison';
     return 'general';
   }
 
@@ -388,9 +390,10 @@ class EnhancedNavigationAgent {
   }
 
   determineNavigationGoal(task) {
-    if (task.toLowerCase().includes('explore')) return 'Site Exploration';
-    if (task.toLowerCase().includes('find')) return 'Information Discovery';
-    if (task.toLowerCase().includes('check')) return 'Site Verification';
+    const lowerTask = task.toLowerCase();
+    if (lowerTask.includes('explore')) return 'Site Exploration';
+    if (lowerTask.includes('find')) return 'Information Discovery';
+    if (lowerTask.includes('check')) return 'Site Verification';
     return 'Web Navigation';
   }
 
@@ -489,11 +492,12 @@ class EnhancedShoppingAgent {
     
     // Add specific retailers if mentioned
     const mentionedRetailers = [];
-    if (task.toLowerCase().includes('amazon')) mentionedRetailers.push('amazon');
-    if (task.toLowerCase().includes('ebay')) mentionedRetailers.push('ebay');
-    if (task.toLowerCase().includes('walmart')) mentionedRetailers.push('walmart');
-    if (task.toLowerCase().includes('target')) mentionedRetailers.push('target');
-    if (task.toLowerCase().includes('best buy')) mentionedRetailers.push('bestbuy');
+    const lowerTask = task.toLowerCase();
+    if (lowerTask.includes('amazon')) mentionedRetailers.push('amazon');
+    if (lowerTask.includes('ebay')) mentionedRetailers.push('ebay');
+    if (lowerTask.includes('walmart')) mentionedRetailers.push('walmart');
+    if (lowerTask.includes('target')) mentionedRetailers.push('target');
+    if (lowerTask.includes('best buy')) mentionedRetailers.push('bestbuy');
 
     return mentionedRetailers.length > 0 ? mentionedRetailers : defaultRetailers;
   }
@@ -691,8 +695,9 @@ Sincerely,
   }
 
   needsFormFilling(task) {
-    return task.toLowerCase().includes('fill') && 
-           (task.toLowerCase().includes('form') || task.toLowerCase().includes('application'));
+    const lowerTask = task.toLowerCase();
+    return lowerTask.includes('fill') && 
+           (lowerTask.includes('form') || lowerTask.includes('application'));
   }
 
   identifyFormUrl(task) {
@@ -343,14 +343,20 @@ class PageContentAnalyzer {
     try {
       const text = content.text || content;
       const keywords = this.extractKeyPhrases(text);
+      // Lowercase once; key phrases are already lowercase, so plain substring
+      // counting replaces a freshly compiled case-insensitive regex per phrase
+      const lowerText = text.toLowerCase();
       
       // Calculate keyword frequency and importance
-      const keywordAnalysis = keywords.map(keyword => ({
-        keyword,
-        frequency: (text.match(new RegExp(keyword, 'gi')) || []).length,
-        length: keyword.split(' ').length,
-        importance: this.calculateKeywordImportance(keyword, text)
-      }));
+      const keywordAnalysis = keywords.map(keyword => {
+        const frequency = this.countOccurrences(lowerText, keyword);
+        return {
+          keyword,
+          frequency,
+          length: keyword.split(' ').length,
+          importance: this.calculateKeywordImportance(keyword, lowerText, frequency)
+        };
+      });
       
       // Sort by importance
       keywordAnalysis.sort((a, b) => b.importance - a.importance);
@@ -650,15 +656,22 @@ class PageContentAnalyzer {
     return phrases.slice(0, 50); // Top 50 phrases
   }
 
-  calculateKeywordImportance(keyword, text) {
-    const frequency = (text.match(new RegExp(keyword, 'gi')) || []).length;
+  countOccurrences(text, phrase) {
+    let count = 0;
+    for (let index = text.indexOf(phrase); index !== -1; index = text.indexOf(phrase, index + phrase.length)) {
+      count++;
+    }
+    return count;
+  }
+
+  calculateKeywordImportance(keyword, lowerText, frequency) {
     const length = keyword.split(' ').length;
-    const position = text.toLowerCase().indexOf(keyword.toLowerCase());
+    const position = lowerText.indexOf(keyword);
     
     let importance = frequency * length;
     
     // Boost importance if appears early in text
-    if (position >= 0 && position < text.length * 0.2) {
+    if (position >= 0 && position < lowerText.length * 0.2) {
       importance *= 1.5;
     }
     
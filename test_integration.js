@@ -5,6 +5,7 @@
 
 const path = require('path');
 const fs = require('fs');
+const net = require('net');
 
 // Set environment for headless testing
 process.env.NODE_ENV = 'test';
@@ -13,35 +14,146 @@ process.env.BROWSER_HEADLESS = 'true';
 // Load environment variables
 require('dotenv').config();
 
+const TEST_BOOKMARK_TAGS = Object.freeze(['test', 'integration']);
+
+const REQUIRED_DIRS = Object.freeze([
+  '/app/src/backend',
+  '/app/src/core/agents',
+  '/app/src/core/automation',
+  '/app/src/main/components',
+  '/app/electron',
+  '/app/data'
+]);
+
+const EXPECTED_TABLES = Object.freeze(['bookmarks', 'history', 'agent_memory', 'agent_performance', 'background_tasks', 'agent_health']);
+
+const EXPECTED_AGENTS = Object.freeze(['research', 'navigation', 'shopping', 'communication', 'automation', 'analysis']);
+
+const AGENT_TEST_TASKS = Object.freeze([
+  { task: 'research AI trends', expectedAgent: 'research' },
+  { task: 'navigate to google.com', expectedAgent: 'navigation' },
+  { task: 'find best laptop deals', expectedAgent: 'shopping' },
+  { task: 'compose professional email', expectedAgent: 'communication' },
+  { task: 'automate daily tasks', expectedAgent: 'automation' },
+  { task: 'analyze this page content', expectedAgent: 'analysis' }
+]);
+
+const EXTRACTOR_TYPES = Object.freeze(['product', 'article', 'search_results', 'contact']);
+
+const CORE_FEATURES = Object.freeze({
+  'Database Service': './src/backend/DatabaseService.js',
+  'Agent Performance Monitor': './src/backend/AgentPerformanceMonitor.js', 
+  'Background Task Scheduler': './src/backend/BackgroundTaskScheduler.js',
+  'Enhanced Agent Controller': './src/core/agents/EnhancedAgentController.js',
+  'Browser Automation Engine': './src/core/automation/BrowserAutomationEngine.js',
+  'Intelligent Data Extractor': './src/core/automation/IntelligentDataExtractor.js',
+  'Interaction Simulator': './src/core/automation/InteractionSimulator.js',
+  'Result Compiler': './src/core/automation/ResultCompiler.js'
+});
+
+const UI_COMPONENT_PATHS = Object.freeze([
+  './src/main/App.tsx',
+  './src/main/components/AISidebar.tsx',
+  './src/main/components/TabBar.tsx',
+  './src/main/components/BrowserWindow.tsx',
+  './src/main/components/EnhancedNavigationBar.tsx'
+]);
+
+// Suites that run concurrently after Environment Setup, as [name, method] pairs
+const PARALLEL_SUITES = Object.freeze([
+  ['Database Service Integration', 'testDatabaseService'],
+  ['Agent Controller Integration', 'testAgentController'],
+  ['Browser Automation Engine', 'testBrowserAutomationEngine'],
+  ['Backend Services Coordination', 'testBackendServices'],
+  ['AI Integration (GROQ)', 'testAIIntegration'],
+  ['Data Extraction System', 'testDataExtraction'],
+  ['Feature Utilization Assessment', 'testFeatureUtilization']
+]);
+
+// Parses `--shard K/N` or `--shard=K/N` (1-based) so CI can split the suites across processes
+function parseShard(argv) {
+  const flagIndex = argv.findIndex(arg => arg.startsWith('--shard'));
+  if (flagIndex === -1) return null;
+  
+  const flag = argv[flagIndex];
+  let value;
+  if (flag === '--shard') {
+    value = argv[flagIndex + 1];
+  } else if (flag.startsWith('--shard=')) {
+    value = flag.slice('--shard='.length);
+  } else {
+    throw new Error(`Unknown argument "${flag}", expected --shard K/N or --shard=K/N`);
+  }
+  
+  const match = /^(\d+)\/(\d+)$/.exec(value || '');
+  const index = match ? Number(match[1]) : 0;
+  const count = match ? Number(match[2]) : 0;
+  if (index < 1 || index > count) {
+    throw new Error(`Invalid --shard value "${value}", expected K/N with 1 <= K <= N`);
+  }
+  return { index, count };
+}
+
+// Quick TCP reachability check so an offline run fails fast instead of
+// waiting out the SDK's request timeout
+function probeHost(host, port, timeoutMs) {
+  return new Promise((resolve) => {
+    const socket = net.connect({ host, port });
+    const finish = (reachable) => {
+      socket.destroy();
+      resolve(reachable);
+    };
+    socket.setTimeout(timeoutMs, () => finish(false));
+    socket.once('connect', () => finish(true));
+    socket.once('error', () => finish(false));
+  });
+}
+
 console.log('🧪 KAiro Browser Comprehensive Integration Test');
 console.log('=' .repeat(60));
 
 class IntegrationTester {
-  constructor() {
+  constructor(options = {}) {
+    this.shard = options.shard || null;
     this.results = {
       total: 0,
       passed: 0,
       failed: 0,
-      tests: []
+      tests: [],
+      failures: []
     };
+    this.pending = new Set();
   }
 
   async runTest(name, testFn) {
-    console.log(`\n🔄 Testing: ${name}`);
     this.results.total++;
+    this.pending.add(name);
     
+    // Monotonic clock: durations are immune to wall-clock adjustments
+    const startTime = process.hrtime.bigint();
     try {
-      const startTime = Date.now();
       await testFn();
-      const duration = Date.now() - startTime;
+      const duration = Number((process.hrtime.bigint() - startTime) / 1000000n);
       
       console.log(`✅ PASSED: ${name} (${duration}ms)`);
       this.results.passed++;
-      this.results.tests.push({ name, status: 'PASSED', duration });
+      // Every result entry has the same fields so the records share one object shape
+      this.results.tests.push({ name, status: 'PASSED', duration, error: null });
     } catch (error) {
+      const duration = Number((process.hrtime.bigint() - startTime) / 1000000n);
+      
       console.log(`❌ FAILED: ${name} - ${error.message}`);
+      const result = { name, status: 'FAILED', duration, error: error.message };
       this.results.failed++;
-      this.results.tests.push({ name, status: 'FAILED', error: error.message });
+      this.results.tests.push(result);
+      this.results.failures.push(result);
+    }
+    
+    // Suites run concurrently, so name the ones still outstanding; the last
+    // such line identifies a suite that hangs
+    this.pending.delete(name);
+    if (this.pending.size > 0) {
+      console.log(`⏳ Still running: ${[...this.pending].join(', ')}`);
     }
   }
 
@@ -56,16 +168,7 @@ class IntegrationTester {
     }
 
     // Test directory structure
-    const requiredDirs = [
-      '/app/src/backend',
-      '/app/src/core/agents',
-      '/app/src/core/automation',
-      '/app/src/main/components',
-      '/app/electron',
-      '/app/data'
-    ];
-
-    for (const dir of requiredDirs) {
+    for (const dir of REQUIRED_DIRS) {
       if (!fs.existsSync(dir)) {
         throw new Error(`Required directory missing: ${dir}`);
       }
@@ -78,8 +181,9 @@ class IntegrationTester {
   async testDatabaseService() {
     const { DatabaseService } = require('./src/backend/DatabaseService.js');
     
-    const dbPath = path.join(process.cwd(), 'data', 'test_browser.db');
-    const dbService = new DatabaseService({ path: dbPath });
+    // In-memory database: the round-trip check needs no journaling or disk I/O
+    // and leaves no test database behind in data/
+    const dbService = new DatabaseService({ path: ':memory:' });
     
     // Test initialization
     const initResult = await dbService.initialize();
@@ -91,18 +195,19 @@ class IntegrationTester {
     }
     
     // Test table creation
-    const tables = ['bookmarks', 'history', 'agent_memory', 'agent_performance', 'background_tasks', 'agent_health'];
-    console.log(`📊 Database initialized with ${tables.length} tables`);
+    console.log(`📊 Database initialized with ${EXPECTED_TABLES.length} tables`);
     
     // Test basic operations
+    const now = Date.now();
     const testBookmark = {
-      id: 'test_bookmark_' + Date.now(),
+      id: 'test_bookmark_' + now,
       title: 'Test Bookmark',
       url: 'https://example.com',
       description: 'Test bookmark for integration testing',
-      tags: ['test', 'integration'],
-      createdAt: Date.now(),
-      updatedAt: Date.now()
+      tags: TEST_BOOKMARK_TAGS,
+      createdAt: now,
+      updatedAt: now,
+      lastVisited: now
     };
     
     await dbService.saveBookmark(testBookmark);
@@ -113,6 +218,78 @@ class IntegrationTester {
     }
     
     console.log('💾 Database CRUD operations verified');
+
+    // Test the SQL aggregates against real rows
+    const metrics = [
+      { success: true, duration: 1000, startTime: now - 10000 },
+      { success: true, duration: 1200, startTime: now - 8000 },
+      { success: false, duration: 2000, startTime: now - 5000 }
+    ];
+    for (const [index, metric] of metrics.entries()) {
+      await dbService.savePerformanceMetric({
+        id: `test_metric_${index}`,
+        agentId: 'test_agent',
+        taskType: 'test',
+        startTime: metric.startTime,
+        endTime: metric.startTime + metric.duration,
+        duration: metric.duration,
+        success: metric.success,
+        errorMessage: null,
+        resourceUsage: {},
+        qualityScore: null,
+        metadata: {}
+      });
+    }
+
+    const summary = await dbService.getPerformanceSummary('test_agent', now - 60000);
+    if (summary.totalTasks !== 3 || summary.successfulTasks !== 2 || Math.round(summary.averageDuration) !== 1400) {
+      throw new Error(`Performance summary mismatch: ${JSON.stringify(summary)}`);
+    }
+
+    const tasks = [
+      { id: 'test_task_1', type: 'test', status: 'completed', startedAt: now - 3000, completedAt: now - 1000 },
+      { id: 'test_task_2', type: 'test', status: 'failed', startedAt: now - 3000, completedAt: now - 2000 },
+      { id: 'test_task_3', type: 'cleanup', status: 'pending', startedAt: null, completedAt: null }
+    ].map(task => ({
+      ...task,
+      priority: 5,
+      payload: {},
+      createdAt: now,
+      scheduledFor: now,
+      retryCount: 0,
+      maxRetries: 3,
+      lastError: null,
+      agentId: 'test_agent'
+    }));
+
+    const savedCount = await dbService.saveBackgroundTasks(tasks);
+    if (savedCount !== tasks.length) {
+      throw new Error('Background task batch save failed');
+    }
+
+    const storedTask = await dbService.getBackgroundTask('test_task_1');
+    const mismatchedField = storedTask && Object.keys(tasks[0]).find(
+      key => JSON.stringify(storedTask[key]) !== JSON.stringify(tasks[0][key])
+    );
+    if (!storedTask || mismatchedField) {
+      throw new Error(`Background task round-trip mismatch${mismatchedField ? ` on ${mismatchedField}` : ''}`);
+    }
+    if (await dbService.getBackgroundTask('missing_task') !== null) {
+      throw new Error('Unknown background task id should return null');
+    }
+
+    const counts = await dbService.getBackgroundTaskCounts();
+    if (counts.completed !== 1 || counts.failed !== 1 || counts.pending !== 1) {
+      throw new Error(`Background task counts mismatch: ${JSON.stringify(counts)}`);
+    }
+
+    const typeStats = await dbService.getBackgroundTaskTypeStats();
+    const testStats = typeStats.find(stats => stats.type === 'test');
+    if (!testStats || testStats.total !== 2 || testStats.successful !== 1 || testStats.totalDuration !== 2000) {
+      throw new Error(`Background task type stats mismatch: ${JSON.stringify(typeStats)}`);
+    }
+
+    console.log('📊 Database aggregate queries verified');
     await dbService.close();
   }
 
@@ -138,39 +315,28 @@ class IntegrationTester {
     }
     
     // Test agent availability
-    const expectedAgents = ['research', 'navigation', 'shopping', 'communication', 'automation', 'analysis'];
-    for (const agentType of expectedAgents) {
+    for (const agentType of EXPECTED_AGENTS) {
       if (!agentController.agents.has(agentType)) {
         throw new Error(`Agent not found: ${agentType}`);
       }
     }
     
-    console.log(`🤖 All ${expectedAgents.length} agents initialized successfully`);
-    
-    // Test task analysis
-    const testTasks = [
-      { task: 'research AI trends', expectedAgent: 'research' },
-      { task: 'navigate to google.com', expectedAgent: 'navigation' },
-      { task: 'find best laptop deals', expectedAgent: 'shopping' },
-      { task: 'compose professional email', expectedAgent: 'communication' },
-      { task: 'automate daily tasks', expectedAgent: 'automation' },
-      { task: 'analyze this page content', expectedAgent: 'analysis' }
-    ];
+    console.log(`🤖 All ${EXPECTED_AGENTS.length} agents initialized successfully`);
     
-    let correctClassifications = 0;
-    for (const test of testTasks) {
+    // Test task analysis - plans are independent per agent, so create them concurrently
+    const planResults = await Promise.all(AGENT_TEST_TASKS.map(async (test) => {
       try {
         const plan = await agentController.agents.get(test.expectedAgent).createExecutionPlan(test.task, {});
-        if (plan.success) {
-          correctClassifications++;
-        }
+        return plan.success;
       } catch (error) {
         console.warn(`⚠️ Agent plan creation failed for ${test.expectedAgent}: ${error.message}`);
+        return false;
       }
-    }
+    }));
+    const correctClassifications = planResults.filter(Boolean).length;
     
-    const accuracy = (correctClassifications / testTasks.length * 100).toFixed(1);
-    console.log(`🎯 Agent execution plan accuracy: ${accuracy}% (${correctClassifications}/${testTasks.length})`);
+    const accuracy = (correctClassifications / AGENT_TEST_TASKS.length * 100).toFixed(1);
+    console.log(`🎯 Agent execution plan accuracy: ${accuracy}% (${correctClassifications}/${AGENT_TEST_TASKS.length})`);
     
     if (accuracy < 80) {
       throw new Error(`Low agent plan creation accuracy: ${accuracy}%`);
@@ -231,26 +397,41 @@ class IntegrationTester {
     // Test Agent Performance Monitor
     const { AgentPerformanceMonitor } = require('./src/backend/AgentPerformanceMonitor.js');
     
+    // Single clock snapshot shared by every mock fixture in this test
+    const now = Date.now();
+    const mockMetrics = [
+      { success: true, duration: 1000, startTime: now - 10000 },
+      { success: true, duration: 1200, startTime: now - 8000 },
+      { success: false, duration: 2000, startTime: now - 5000 }
+    ];
     const mockDB = {
       savePerformanceMetric: async () => ({ success: true }),
-      getPerformanceMetrics: async () => ([
-        { success: true, duration: 1000, startTime: Date.now() - 10000 },
-        { success: true, duration: 1200, startTime: Date.now() - 8000 },
-        { success: false, duration: 2000, startTime: Date.now() - 5000 }
-      ]),
+      getPerformanceMetrics: async () => mockMetrics,
+      getPerformanceSummary: async () => ({
+        totalTasks: mockMetrics.length,
+        successfulTasks: mockMetrics.filter(m => m.success).length,
+        averageDuration: mockMetrics.reduce((sum, m) => sum + m.duration, 0) / mockMetrics.length
+      }),
       saveBackgroundTask: async () => ({ success: true }),
+      saveBackgroundTasks: async (tasks) => tasks.length,
+      getBackgroundTask: async () => null,
       getBackgroundTasks: async (status) => ([
-        { id: 'test_task_1', status: status || 'pending', type: 'test', priority: 5, payload: {}, createdAt: Date.now() }
+        { id: 'test_task_1', status: status || 'pending', type: 'test', priority: 5, payload: {}, createdAt: now }
       ]),
       cleanupExpiredMemories: async () => 0,
       cleanupOldHistory: async () => 0
     };
     
+    const { BackgroundTaskScheduler } = require('./src/backend/BackgroundTaskScheduler.js');
+    
     const perfMonitor = new AgentPerformanceMonitor({ updateInterval: 1000, retentionDays: 1 });
     perfMonitor.db = mockDB; // Mock database
+    const taskScheduler = new BackgroundTaskScheduler(mockDB);
     
-    await perfMonitor.initialize();
+    // Both services are independent, so bring them up together
+    await Promise.all([perfMonitor.initialize(), taskScheduler.initialize()]);
     console.log('📊 Agent Performance Monitor initialized');
+    console.log('⏰ Background Task Scheduler initialized');
     
     // Test performance calculation
     const successRate = await perfMonitor.calculateSuccessRate('test_agent');
@@ -260,13 +441,6 @@ class IntegrationTester {
     
     console.log(`📈 Performance calculation verified: ${Math.round(successRate * 100)}% success rate`);
     
-    // Test Background Task Scheduler
-    const { BackgroundTaskScheduler } = require('./src/backend/BackgroundTaskScheduler.js');
-    
-    const taskScheduler = new BackgroundTaskScheduler(mockDB);
-    await taskScheduler.initialize();
-    console.log('⏰ Background Task Scheduler initialized');
-    
     // Test task scheduling
     const taskId = await taskScheduler.scheduleTask('agent_learning', { agentId: 'test' }, { priority: 5 });
     if (!taskId) {
@@ -288,6 +462,10 @@ class IntegrationTester {
     
     console.log('🧠 Testing GROQ AI connection...');
     
+    if (!(await probeHost('api.groq.com', 443, 2000))) {
+      throw new Error('GROQ API unreachable: no connection to api.groq.com:443 within 2s');
+    }
+    
     try {
       const completion = await groq.chat.completions.create({
         messages: [
@@ -302,13 +480,13 @@ class IntegrationTester {
         ],
         model: 'llama-3.3-70b-versatile',
         temperature: 0,
-        max_tokens: 50
+        max_tokens: 16 // the expected reply is ~5 tokens; cap generation time
       });
 
       const response = completion.choices[0].message.content.trim();
       console.log(`🤖 AI Response: "${response}"`);
       
-      if (!response.toLowerCase().includes('integration') || !response.toLowerCase().includes('successful')) {
+      if (!/integration/i.test(response) || !/successful/i.test(response)) {
         throw new Error(`Unexpected AI response: ${response}`);
       }
       
@@ -347,35 +525,23 @@ class IntegrationTester {
     console.log('🔍 Data transformation methods verified');
     
     // Test extractor configurations
-    const extractorTypes = ['product', 'article', 'search_results', 'contact'];
-    for (const type of extractorTypes) {
+    for (const type of EXTRACTOR_TYPES) {
       if (!dataExtractor.extractors.has(type)) {
         throw new Error(`Missing extractor configuration: ${type}`);
       }
     }
     
-    console.log(`📋 All ${extractorTypes.length} extractor configurations verified`);
+    console.log(`📋 All ${EXTRACTOR_TYPES.length} extractor configurations verified`);
   }
 
   async testFeatureUtilization() {
     console.log('🎯 Testing feature utilization and accessibility...');
     
     // Verify all core features are implemented and accessible
-    const coreFeatures = {
-      'Database Service': './src/backend/DatabaseService.js',
-      'Agent Performance Monitor': './src/backend/AgentPerformanceMonitor.js', 
-      'Background Task Scheduler': './src/backend/BackgroundTaskScheduler.js',
-      'Enhanced Agent Controller': './src/core/agents/EnhancedAgentController.js',
-      'Browser Automation Engine': './src/core/automation/BrowserAutomationEngine.js',
-      'Intelligent Data Extractor': './src/core/automation/IntelligentDataExtractor.js',
-      'Interaction Simulator': './src/core/automation/InteractionSimulator.js',
-      'Result Compiler': './src/core/automation/ResultCompiler.js'
-    };
-    
     let accessibleFeatures = 0;
-    const totalFeatures = Object.keys(coreFeatures).length;
+    const totalFeatures = Object.keys(CORE_FEATURES).length;
     
-    for (const [featureName, featurePath] of Object.entries(coreFeatures)) {
+    for (const [featureName, featurePath] of Object.entries(CORE_FEATURES)) {
       try {
         const feature = require(featurePath);
         if (feature && typeof feature === 'object') {
@@ -397,81 +563,82 @@ class IntegrationTester {
     }
     
     // Test UI components accessibility
-    const uiComponents = [
-      './src/main/App.tsx',
-      './src/main/components/AISidebar.tsx',
-      './src/main/components/TabBar.tsx',
-      './src/main/components/BrowserWindow.tsx',
-      './src/main/components/EnhancedNavigationBar.tsx'
-    ];
-    
     let accessibleComponents = 0;
-    for (const component of uiComponents) {
+    for (const component of UI_COMPONENT_PATHS) {
       if (fs.existsSync(component)) {
         accessibleComponents++;
       }
     }
     
-    const componentUtilization = (accessibleComponents / uiComponents.length * 100).toFixed(1);
-    console.log(`🎨 UI component utilization: ${componentUtilization}% (${accessibleComponents}/${uiComponents.length})`);
+    const componentUtilization = (accessibleComponents / UI_COMPONENT_PATHS.length * 100).toFixed(1);
+    console.log(`🎨 UI component utilization: ${componentUtilization}% (${accessibleComponents}/${UI_COMPONENT_PATHS.length})`);
   }
 
   async runAllTests() {
     console.log(`🚀 Starting comprehensive integration testing...\n`);
     
-    // Run all tests
+    // Environment checks are a prerequisite for everything else
+    console.log('🔄 Testing: Environment Setup');
     await this.runTest('Environment Setup', () => this.testEnvironmentSetup());
-    await this.runTest('Database Service Integration', () => this.testDatabaseService());
-    await this.runTest('Agent Controller Integration', () => this.testAgentController());
-    await this.runTest('Browser Automation Engine', () => this.testBrowserAutomationEngine());
-    await this.runTest('Backend Services Coordination', () => this.testBackendServices());
-    await this.runTest('AI Integration (GROQ)', () => this.testAIIntegration());
-    await this.runTest('Data Extraction System', () => this.testDataExtraction());
-    await this.runTest('Feature Utilization Assessment', () => this.testFeatureUtilization());
+    
+    // Remaining suites are independent - run them concurrently so the GROQ
+    // round-trip overlaps with database and module-loading work. With --shard K/N
+    // only every Nth suite starting at K runs in this process.
+    const suites = this.shard
+      ? PARALLEL_SUITES.filter((suite, index) => index % this.shard.count === this.shard.index - 1)
+      : PARALLEL_SUITES;
+    if (this.shard) {
+      console.log(`🧩 Shard ${this.shard.index}/${this.shard.count}: ${suites.length} of ${PARALLEL_SUITES.length} suites`);
+    }
+    
+    await Promise.all(suites.map(([name, method]) => this.runTest(name, () => this[method]())));
     
     // Print results
     this.printResults();
   }
 
   printResults() {
-    console.log('\n' + '='.repeat(60));
-    console.log('🎯 INTEGRATION TEST RESULTS');
-    console.log('='.repeat(60));
+    const lines = [
+      '\n' + '='.repeat(60),
+      '🎯 INTEGRATION TEST RESULTS',
+      '='.repeat(60)
+    ];
     
     const successRate = (this.results.passed / this.results.total * 100).toFixed(1);
     
-    console.log(`📊 Total Tests: ${this.results.total}`);
-    console.log(`✅ Passed: ${this.results.passed}`);
-    console.log(`❌ Failed: ${this.results.failed}`);
-    console.log(`📈 Success Rate: ${successRate}%`);
+    lines.push(
+      `📊 Total Tests: ${this.results.total}`,
+      `✅ Passed: ${this.results.passed}`,
+      `❌ Failed: ${this.results.failed}`,
+      `📈 Success Rate: ${successRate}%`
+    );
     
     if (this.results.failed > 0) {
-      console.log('\n❌ FAILED TESTS:');
-      this.results.tests
-        .filter(test => test.status === 'FAILED')
-        .forEach(test => {
-          console.log(`  • ${test.name}: ${test.error}`);
-        });
+      lines.push('\n❌ FAILED TESTS:');
+      this.results.failures.forEach(test => {
+        lines.push(`  • ${test.name}: ${test.error}`);
+      });
     }
     
-    console.log('\n🏆 ASSESSMENT:');
+    lines.push('\n🏆 ASSESSMENT:');
     if (successRate >= 90) {
-      console.log('🟢 EXCELLENT - All systems highly integrated and optimized');
+      lines.push('🟢 EXCELLENT - All systems highly integrated and optimized');
     } else if (successRate >= 80) {
-      console.log('🟡 GOOD - Systems working well with minor optimization needed');
+      lines.push('🟡 GOOD - Systems working well with minor optimization needed');
     } else if (successRate >= 70) {
-      console.log('🟠 FAIR - Systems functional but need significant optimization');
+      lines.push('🟠 FAIR - Systems functional but need significant optimization');
     } else {
-      console.log('🔴 POOR - Major integration issues need immediate attention');
+      lines.push('🔴 POOR - Major integration issues need immediate attention');
     }
     
-    console.log('\n✨ Integration testing completed!');
+    lines.push('\n✨ Integration testing completed!');
+    console.log(lines.join('\n'));
   }
 }
 
 // Run the integration tests
 async function main() {
-  const tester = new IntegrationTester();
+  const tester = new IntegrationTester({ shard: parseShard(process.argv.slice(2)) });
   await tester.runAllTests();
   
   // Exit with appropriate code